@@ -5,6 +5,7 @@ Implements retries, simple error handling, and collects execution logs.
 from __future__ import annotations
 import asyncio
 import importlib
+from itertools import chain
 from typing import List
 from src.utils.config import load_config
 
@@ -12,6 +13,10 @@ from src.utils.config import load_config
 class Controller:
     def __init__(self, cfg=None, use_enhanced=True):
         self.cfg = cfg or load_config()
+        # retries after the first attempt (0 disables retrying) and base
+        # delay for exponential backoff
+        self.max_retries = max(0, int(self.cfg.get("MAX_RETRIES") or 1))
+        self.retry_base_delay = float(self.cfg.get("RETRY_BASE_DELAY") or 0.25)
         # tool registry maps tool name to module path
         # Use enhanced tools if available
         if use_enhanced:
@@ -38,65 +43,139 @@ class Controller:
                 "resume_analyzer": "src.tools.resume_analyzer_tool",
                 "job_matcher": "src.tools.job_matcher_tool",
             }
+        # cache imported tool modules so repeated steps skip the import machinery
+        self._module_cache: dict = {}
+        # per-tool dispatch table: tool name -> (callable, is_coroutine),
+        # resolved once so steps skip hasattr/iscoroutinefunction probes
+        self._dispatch: dict = {}
+        # eagerly import every registered tool so no step pays import cost
+        # (or contends on the import lock) inside the async execution path
+        for name in list(self.tool_map):
+            self._register(name)
+
+    def _register(self, name: str):
+        """Import and resolve one registered tool; drop it if broken."""
+        path = self.tool_map[name]
+        try:
+            module = self._module_cache.get(path)
+            if module is None:
+                module = importlib.import_module(path)
+                self._module_cache[path] = module
+            self._dispatch[name] = self._resolve_tool(module, path)
+        except Exception as e:
+            # a broken optional tool shouldn't kill the controller
+            print(f"Warning: could not load tool '{name}' ({path}): {e}")
+            del self.tool_map[name]
+
+    async def warmup(self):
+        """Re-resolve any tool that is registered but not yet dispatchable.
+
+        Construction already imports everything eagerly; servers call this
+        at startup so the first request never pays import or instantiation
+        cost, and load failures surface before traffic arrives.
+        """
+        for name in list(self.tool_map):
+            if name not in self._dispatch:
+                self._register(name)
+
+    def _resolve_tool(self, module, module_path: str):
+        """Resolve a tool module to its run callable once, at registry build."""
+        # Each tool exposes a module-level run(), or a Tool class we wrap
+        if hasattr(module, "run"):
+            fn = getattr(module, "run")
+        elif hasattr(module, "Tool"):
+            fn = getattr(module, "Tool")(self.cfg).run
+        else:
+            raise ValueError(f"Tool module {module_path} missing run() or Tool class")
+        return fn, asyncio.iscoroutinefunction(fn)
 
     async def execute_plan(self, plan: dict) -> List[str]:
         logs = []
         steps = plan.get("steps", [])
         context = {"plan_input": plan.get("input")}
 
-        for step in steps:
-            tool_name = step.get("tool")
-            args = step.get("args", {})
-            logs.append(f"Starting step {step.get('id')} -> {tool_name}")
+        # Group steps into dependency levels and run each level concurrently.
+        # Steps within a level are independent, so I/O-bound tools overlap.
+        for level in self._dependency_levels(steps):
+            results = await asyncio.gather(*(self._run_step(step, context) for step in level))
+            # single C-level extend per level instead of per-item appends
+            logs.extend(chain.from_iterable(results))
+        return logs
+
+    @staticmethod
+    def _dependency_levels(steps: List[dict]) -> List[List[dict]]:
+        """Group steps into topological levels by their `deps` field.
+
+        A step may declare `deps: [id, ...]` naming the steps it needs.
+        Steps without an explicit `deps` depend on the previous step, which
+        preserves the original strictly-sequential behaviour for old plans.
+        """
+        by_id = {s.get("id"): s for s in steps}
+        deps = {}
+        prev_id = None
+        for s in steps:
+            sid = s.get("id")
+            declared = s.get("deps")
+            if declared is None:
+                deps[sid] = {prev_id} if prev_id is not None else set()
+            else:
+                deps[sid] = {d for d in declared if d in by_id}
+            prev_id = sid
+
+        levels = []
+        placed = set()
+        remaining = [s.get("id") for s in steps]
+        while remaining:
+            ready = [sid for sid in remaining if deps[sid] <= placed]
+            if not ready:
+                # cycle or bad deps: fall back to declared order
+                ready = remaining[:]
+            levels.append([by_id[sid] for sid in ready])
+            placed.update(ready)
+            remaining = [sid for sid in remaining if sid not in placed]
+        return levels
+
+    async def _run_step(self, step: dict, context: dict) -> List[str]:
+        """Run one step with retry; returns its logs.
+
+        Each step only writes its own `step_{id}_output` key, so concurrent
+        steps can share the context dict without locks.
+        """
+        tool_name = step.get("tool")
+        args = step.get("args", {})
+        sid = step.get("id")
+        logs = [f"Starting step {sid} -> {tool_name}"]
+        # first attempt plus max_retries retries; always at least one run
+        attempts = self.max_retries + 1
+        for attempt in range(attempts):
             try:
                 tool_logs, output = await self._invoke_tool(tool_name, args, context)
-                for l in tool_logs:
-                    logs.append(l)
+                logs.extend(tool_logs)
                 # optionally store results in context
                 if output is not None:
-                    context_key = f"step_{step.get('id')}_output"
-                    context[context_key] = output
-                logs.append(f"Finished step {step.get('id')} -> {tool_name}")
+                    context[f"step_{sid}_output"] = output
+                suffix = "retry step" if attempt else "step"
+                logs.append(f"Finished {suffix} {sid} -> {tool_name}")
+                break
             except Exception as e:
-                err = f"Error in step {step.get('id')} ({tool_name}): {e}"
-                logs.append(err)
-                # retry once for transient errors
-                logs.append(f"Retrying step {step.get('id')} -> {tool_name}")
-                try:
-                    tool_logs, output = await self._invoke_tool(tool_name, args, context)
-                    for l in tool_logs:
-                        logs.append(l)
-                    if output is not None:
-                        context[f"step_{step.get('id')}_output"] = output
-                    logs.append(f"Finished retry step {step.get('id')} -> {tool_name}")
-                except Exception as e2:
-                    logs.append(f"Failed retry for step {step.get('id')}: {e2}")
-                    # continue to next step
+                if attempt + 1 >= attempts:
+                    logs.append(f"Failed retry for step {sid}: {e}")
+                    # give up; continue with the rest of the plan
+                    break
+                logs.append(f"Error in step {sid} ({tool_name}): {e}")
+                # back off before retrying transient (rate-limit etc.) errors
+                delay = self.retry_base_delay * (2 ** attempt)
+                logs.append(f"Retrying step {sid} -> {tool_name} in {delay:.2f}s")
+                await asyncio.sleep(delay)
         return logs
 
     async def _invoke_tool(self, tool_name: str, args: dict, context: dict):
-        module_path = self.tool_map.get(tool_name)
-        if not module_path:
+        dispatch = self._dispatch.get(tool_name)
+        if dispatch is None:
             raise ValueError(f"Unknown tool: {tool_name}")
 
-        module = importlib.import_module(module_path)
-        # Each tool exposes a class named <CamelCase>Tool, but we provide a runtime function run()
-        if hasattr(module, "run"):
-            # run may be sync or async
-            fn = getattr(module, "run")
-            if asyncio.iscoroutinefunction(fn):
-                return await fn(args, context)
-            else:
-                # run in threadpool
-                loop = asyncio.get_event_loop()
-                return await loop.run_in_executor(None, lambda: fn(args, context))
-        elif hasattr(module, "Tool"):
-            ToolCls = getattr(module, "Tool")
-            inst = ToolCls(self.cfg)
-            if asyncio.iscoroutinefunction(inst.run):
-                return await inst.run(args, context)
-            else:
-                loop = asyncio.get_event_loop()
-                return await loop.run_in_executor(None, lambda: inst.run(args, context))
-        else:
-            raise ValueError(f"Tool module {module_path} missing run() or Tool class")
+        fn, is_coroutine = dispatch
+        if is_coroutine:
+            return await fn(args, context)
+        # run sync tools in the threadpool
+        return await asyncio.to_thread(fn, args, context)
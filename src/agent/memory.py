@@ -1,35 +1,115 @@
-"""Simple file-backed memory/context manager.
-
-Stores contexts in a JSON file and provides basic read/write operations.
-"""
-import json
-from pathlib import Path
-from typing import Any
-
-
-class Memory:
-    def __init__(self, path: str | None = None):
-        self.path = Path(path or "agent_memory.json")
-        if not self.path.exists():
-            self._write({})
-
-    def _read(self) -> dict:
-        try:
-            return json.loads(self.path.read_text(encoding="utf-8"))
-        except Exception:
-            return {}
-
-    def _write(self, data: dict):
-        self.path.write_text(json.dumps(data, indent=2), encoding="utf-8")
-
-    def get(self, key: str, default: Any = None) -> Any:
-        data = self._read()
-        return data.get(key, default)
-
-    def set(self, key: str, value: Any):
-        data = self._read()
-        data[key] = value
-        self._write(data)
-
-    def clear(self):
-        self._write({})
+"""Simple file-backed memory/context manager.
+
+Stores contexts in a JSON-Lines append log and provides basic read/write
+operations. Writes append a single entry instead of rewriting the whole
+file; the log is compacted back to a snapshot when it grows well past the
+number of live keys.
+"""
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+
+def _dumps(obj) -> str:
+    if orjson:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+def _loads(raw):
+    if orjson:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+class Memory:
+    # compact when the log holds this many times more entries than live keys
+    COMPACT_FACTOR = 4
+    COMPACT_MIN_ENTRIES = 64
+
+    def __init__(self, path: str | None = None):
+        self.path = Path(path or "agent_memory.json")
+        self._cache: dict = {}
+        self._log_entries = 0
+        self._dirty = False
+        if self.path.exists():
+            self._load()
+        else:
+            self.path.write_text("", encoding="utf-8")
+
+    def _load(self):
+        """Cold-load the log (or a legacy whole-dict snapshot) into the cache."""
+        try:
+            raw = self.path.read_text(encoding="utf-8")
+        except Exception:
+            return
+        try:
+            # legacy format: the whole file is one JSON dict
+            data = _loads(raw)
+            if isinstance(data, dict) and "k" not in data:
+                self._cache = data
+                self._log_entries = len(data)
+                return
+        except Exception:
+            pass
+        # JSON-Lines log: fold entries in order, later writes win
+        for line in raw.splitlines():
+            if not line.strip():
+                continue
+            try:
+                entry = _loads(line)
+                self._cache[entry["k"]] = entry["v"]
+                self._log_entries += 1
+            except Exception:
+                continue
+
+    def _append(self, key: str, value: Any):
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(_dumps({"k": key, "v": value}) + "\n")
+        self._log_entries += 1
+        self._dirty = True
+        if self._log_entries >= max(self.COMPACT_MIN_ENTRIES, self.COMPACT_FACTOR * len(self._cache)):
+            self._compact()
+
+    def _compact(self):
+        """Rewrite the log as one entry per live key."""
+        self._snapshot()
+
+    def _snapshot(self):
+        """Atomically replace the log with one entry per live key."""
+        lines = [_dumps({"k": k, "v": v}) for k, v in self._cache.items()]
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
+        tmp.replace(self.path)
+        self._log_entries = len(self._cache)
+        self._dirty = False
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._cache.get(key, default)
+
+    def set(self, key: str, value: Any):
+        self._cache[key] = value
+        self._append(key, value)
+
+    def flush(self):
+        """Checkpoint the in-memory state to disk (atomic snapshot)."""
+        if self._dirty or self._log_entries != len(self._cache):
+            self._snapshot()
+
+    def clear(self):
+        self._cache = {}
+        self._log_entries = 0
+        self._dirty = False
+        self.path.write_text("", encoding="utf-8")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.flush()
+        return False
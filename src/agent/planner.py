@@ -9,6 +9,42 @@ import os
 import json
 from src.utils.config import load_config
 
+# Intent keywords and query patterns are built once at import time so the
+# per-request plan() call does no list construction or regex compilation.
+# Keywords are matched as substrings to also catch plurals ("internships").
+_SEARCH_KW = ("find", "search", "look for", "top", "list")
+_SCRAPE_KW = ("scrape", "details", "summarize", "summary", "compare", "internship", "course")
+_SUMMARY_KW = ("summarize", "summary", "bullet", "compare", "comparison")
+_EMAIL_KW = ("email", "send")
+
+# One keyword can signal several intents ("summary" triggers both scrape and
+# summarize), so map keyword -> intents and scan the command in a single
+# regex pass instead of one substring walk per keyword.
+_KEYWORD_INTENTS: dict = {}
+for _intent, _kws in (
+    ("search", _SEARCH_KW),
+    ("scrape", _SCRAPE_KW),
+    ("summarize", _SUMMARY_KW),
+    ("email", _EMAIL_KW),
+):
+    for _kw in _kws:
+        _KEYWORD_INTENTS.setdefault(_kw, set()).add(_intent)
+_INTENT_RE = re.compile(
+    "|".join(re.escape(k) for k in sorted(_KEYWORD_INTENTS, key=len, reverse=True))
+)
+
+_QUERY_PATTERNS = [
+    re.compile(p, re.IGNORECASE)
+    for p in (r"find me (.+)", r"search for (.+)", r"look for (.+)", r"find (.+)")
+]
+
+
+def _detect_intents(cmd: str) -> set:
+    intents = set()
+    for m in _INTENT_RE.finditer(cmd):
+        intents |= _KEYWORD_INTENTS[m.group(0)]
+    return intents
+
 
 class Planner:
     def __init__(self, cfg=None):
@@ -21,42 +57,53 @@ class Planner:
         {
             "input": "...",
             "steps": [
-                {"id": 1, "tool": "search", "args": {...}},
-                {"id": 2, "tool": "scrape", "args": {...}},
-                {"id": 3, "tool": "summarize", "args": {...}},
-                {"id": 4, "tool": "email", "args": {...}}
+                {"id": 1, "tool": "search", "args": {...}, "deps": []},
+                {"id": 2, "tool": "scrape", "args": {...}, "deps": [1]},
+                {"id": 3, "tool": "summarize", "args": {...}, "deps": [2]},
+                {"id": 4, "tool": "email", "args": {...}, "deps": [3]}
             ]
         }
+
+        Each step declares `deps` — the step ids it needs — so the
+        controller can run independent steps concurrently. The data steps
+        form a chain (each consumes the previous output), while the logger
+        has no inputs and runs alongside the first step.
         """
         cmd = command.lower()
+        intents = _detect_intents(cmd)
         steps = []
         sid = 1
+        prev = None
 
         # detect 'search' intent
-        if any(k in cmd for k in ["find", "search", "look for", "top", "list"]):
+        if "search" in intents:
             # determine query phrase
             q = self._extract_search_query(command)
-            steps.append({"id": sid, "tool": "search", "args": {"query": q, "limit": 5}})
+            steps.append({"id": sid, "tool": "search", "args": {"query": q, "limit": 5}, "deps": []})
+            prev = sid
             sid += 1
 
         # detect 'scrape' or need to open links
-        if any(k in cmd for k in ["scrape", "details", "summarize", "summary", "compare"]) or "internship" in cmd or "course" in cmd:
+        if "scrape" in intents:
             # Add a scraping step to fetch details from search results
-            steps.append({"id": sid, "tool": "scrape", "args": {"top_k": 3}})
+            steps.append({"id": sid, "tool": "scrape", "args": {"top_k": 3}, "deps": [prev] if prev else []})
+            prev = sid
             sid += 1
 
         # detect summarization
-        if any(k in cmd for k in ["summarize", "summary", "bullet", "compare", "comparison"]):
-            steps.append({"id": sid, "tool": "summarize", "args": {"mode": "bullet", "max_sentences": 8}})
+        if "summarize" in intents:
+            steps.append({"id": sid, "tool": "summarize", "args": {"mode": "bullet", "max_sentences": 8}, "deps": [prev] if prev else []})
+            prev = sid
             sid += 1
 
         # email
-        if target_email or "email" in cmd or "send" in cmd:
-            steps.append({"id": sid, "tool": "email", "args": {"to": target_email or "", "subject": f"Automation result for: {command}"}})
+        if target_email or "email" in intents:
+            steps.append({"id": sid, "tool": "email", "args": {"to": target_email or "", "subject": f"Automation result for: {command}"}, "deps": [prev] if prev else []})
+            prev = sid
             sid += 1
 
-        # always log
-        steps.append({"id": sid, "tool": "logger", "args": {"message": f"Completed task: {command}"}})
+        # always log; independent of the data steps, so no deps
+        steps.append({"id": sid, "tool": "logger", "args": {"message": f"Completed task: {command}"}, "deps": []})
 
         plan = {"input": command, "steps": steps}
 
@@ -65,9 +112,8 @@ class Planner:
     def _extract_search_query(self, command: str) -> str:
         # Very simple heuristics for common queries
         # For example: "Find me top 5 internships in Bangalore" -> "top internships in Bangalore"
-        patterns = [r"find me (.+)", r"search for (.+)", r"look for (.+)", r"find (.+)"]
-        for p in patterns:
-            m = re.search(p, command, re.IGNORECASE)
+        for p in _QUERY_PATTERNS:
+            m = p.search(command)
             if m:
                 return m.group(1)
         # fallback: whole command
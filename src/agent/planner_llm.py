@@ -6,33 +6,32 @@ from __future__ import annotations
 import os
 import json
 import re
+import threading
 from src.utils.config import load_config
 
 # Import the rule-based planner logic
 from src.agent.planner import Planner as RulePlanner
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+# matches a fenced ```json ... ``` block (or plain ``` ... ```)
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
 
-class LLMPlanner:
-    def __init__(self, cfg=None):
-        self.cfg = cfg or load_config()
-        self.rule_planner = RulePlanner(cfg)
-    
-    def plan(self, command: str, target_email: str | None = None) -> dict:
-        """Generate plan using LLM if available, else rule-based."""
-        planner_mode = os.getenv("PLANNER_MODE", "rule")
-        
-        if planner_mode == "llm" and os.getenv("OPENAI_API_KEY"):
-            return self._plan_with_llm(command, target_email)
-        else:
-            return self.rule_planner.plan(command, target_email)
-    
-    def _plan_with_llm(self, command: str, target_email: str | None = None) -> dict:
-        """Use OpenAI to generate a detailed execution plan."""
-        try:
-            from openai import OpenAI
-            client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-            
-            system_prompt = """You are a task planning agent. Given a user command, break it down into ordered steps using these tools:
+
+def _parse_plan_json(content: str) -> dict:
+    """Parse LLM output: try raw JSON first, then strip a markdown fence."""
+    loads = orjson.loads if orjson else json.loads
+    try:
+        return loads(content)
+    except Exception:
+        m = _JSON_FENCE_RE.search(content)
+        payload = m.group(1).strip() if m else content
+        return loads(payload)
+
+_SYSTEM_PROMPT = """You are a task planning agent. Given a user command, break it down into ordered steps using these tools:
 
 Available tools:
 - search: Search the web for information. Args: {"query": str, "limit": int}
@@ -45,14 +44,55 @@ Return ONLY a valid JSON object with this structure:
 {
   "input": "<original command>",
   "steps": [
-    {"id": 1, "tool": "search", "args": {...}},
-    {"id": 2, "tool": "scrape", "args": {...}},
+    {"id": 1, "tool": "search", "args": {...}, "deps": []},
+    {"id": 2, "tool": "scrape", "args": {...}, "deps": [1]},
     ...
   ]
 }
 
+Each step's "deps" lists the ids of the steps whose output it needs. Steps whose deps are all satisfied run concurrently, so only declare a dependency when the step really consumes the other step's output (e.g. scrape needs search results, summarize needs scraped pages, logger needs nothing). If unsure, depend on the previous step.
+
 Be specific with queries and arguments. Do not include markdown formatting or explanations."""
 
+# Shared OpenAI client so the httpx connection pool (and its TLS sessions)
+# persists across requests instead of being rebuilt per plan() call.
+_CLIENT = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def _get_client():
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                from openai import OpenAI
+                _CLIENT = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    return _CLIENT
+
+
+class LLMPlanner:
+    def __init__(self, cfg=None):
+        self.cfg = cfg or load_config()
+        self.rule_planner = RulePlanner(cfg)
+        self.reload_env()
+
+    def reload_env(self):
+        """Re-read planner env vars; call after changing them at runtime."""
+        self._mode = os.getenv("PLANNER_MODE", "rule")
+        self._api_key = os.getenv("OPENAI_API_KEY")
+
+    def plan(self, command: str, target_email: str | None = None) -> dict:
+        """Generate plan using LLM if available, else rule-based."""
+        if self._mode == "llm" and self._api_key:
+            return self._plan_with_llm(command, target_email)
+        else:
+            return self.rule_planner.plan(command, target_email)
+    
+    def _plan_with_llm(self, command: str, target_email: str | None = None) -> dict:
+        """Use OpenAI to generate a detailed execution plan."""
+        try:
+            client = _get_client()
+
             user_prompt = f"Command: {command}"
             if target_email:
                 user_prompt += f"\nTarget email: {target_email}"
@@ -60,7 +100,7 @@ Be specific with queries and arguments. Do not include markdown formatting or ex
             response = client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
-                    {"role": "system", "content": system_prompt},
+                    {"role": "system", "content": _SYSTEM_PROMPT},
                     {"role": "user", "content": user_prompt}
                 ],
                 temperature=0.3,
@@ -68,14 +108,9 @@ Be specific with queries and arguments. Do not include markdown formatting or ex
             )
             
             content = response.choices[0].message.content.strip()
-            
-            # Extract JSON from potential markdown code blocks
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
-            
-            plan = json.loads(content)
+
+            # Fast path parses as-is; fence stripping only on failure
+            plan = _parse_plan_json(content)
             
             # Ensure plan has required structure
             if "input" not in plan:
@@ -0,0 +1,28 @@
+"""Process-wide accessors for the shared Controller and Planner.
+
+The CLI, Streamlit GUI, and FastAPI app all go through these so config
+loading, tool imports, and planner setup happen once per process instead
+of once per entry point (or per GUI click).
+"""
+from __future__ import annotations
+import os
+from functools import lru_cache
+
+from src.agent.controller import Controller
+from src.agent.planner import Planner as RulePlanner
+from src.agent.planner_llm import LLMPlanner
+from src.utils.config import load_config
+
+
+@lru_cache(maxsize=None)
+def get_controller() -> Controller:
+    return Controller(load_config(), use_enhanced=True)
+
+
+@lru_cache(maxsize=None)
+def get_planner():
+    """Return the configured planner (LLM when PLANNER_MODE=llm, else rule-based)."""
+    cfg = load_config()
+    if os.getenv("PLANNER_MODE", "rule") == "llm":
+        return LLMPlanner(cfg)
+    return RulePlanner(cfg)
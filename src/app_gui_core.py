@@ -0,0 +1,67 @@
+"""Streamlit-free helpers for the GUI.
+
+Kept separate from `app_gui` so importing these (e.g. from tests or other
+entry points) never pays the Streamlit import cost.
+"""
+import asyncio
+import json
+import threading
+from datetime import datetime
+from typing import Optional
+
+from src.agent.registry import get_controller, get_planner
+from src.utils.config import load_config
+
+# Long-lived background event loop shared across Streamlit reruns, so
+# clicking Execute doesn't tear down connection pools and executors each time
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_LOCK = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _LOOP
+    if _LOOP is None or _LOOP.is_closed():
+        with _LOOP_LOCK:
+            if _LOOP is None or _LOOP.is_closed():
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, daemon=True, name="agent-loop").start()
+                _LOOP = loop
+    return _LOOP
+
+
+def get_planner_mode():
+    """Get the current planner mode from config."""
+    cfg = load_config()
+    return cfg.get("PLANNER_MODE", "rule")
+
+
+def execute_command_async(command: str, email: Optional[str] = None):
+    """Execute a command using the agent."""
+    try:
+        # Shared process-wide planner/controller (no per-click rebuilds)
+        planner = get_planner()
+        controller = get_controller()
+
+        # Create plan
+        plan = planner.plan(command, email)
+
+        # Run on the persistent background loop
+        future = asyncio.run_coroutine_threadsafe(controller.execute_plan(plan), _get_loop())
+        logs = future.result()
+
+        return {
+            "success": True,
+            "plan": plan,
+            "logs": logs,
+            # pre-render once here so the History tab doesn't re-serialize
+            # the plan and re-emit logs line-by-line on every rerun
+            "logs_joined": "\n".join(logs),
+            "plan_pretty": json.dumps(plan, indent=2),
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "timestamp": datetime.now().isoformat()
+        }
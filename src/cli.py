@@ -1,14 +1,11 @@
 """Simple CLI runner for the agent (demo)."""
-from src.agent.planner import Planner
-from src.agent.controller import Controller
-from src.utils.config import load_config
+from src.agent.registry import get_controller, get_planner
 import asyncio
 
 
 async def main():
-    cfg = load_config()
-    planner = Planner(cfg)
-    controller = Controller(cfg)
+    planner = get_planner()
+    controller = get_controller()
 
     print("Personal Task Automation Agent (CLI)")
     cmd = input("Enter task: ")
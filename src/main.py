@@ -1,19 +1,23 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 from typing import Optional
-import os
-from src.agent.planner import Planner as RulePlanner
-from src.agent.planner_llm import LLMPlanner
-from src.agent.controller import Controller
-from src.utils.config import load_config
-
-app = FastAPI(title="Personal Task Automation Agent")
-
-cfg = load_config()
-# Use LLM planner if configured, else rule-based
-planner_mode = os.getenv("PLANNER_MODE", "rule")
-planner = LLMPlanner(cfg) if planner_mode == "llm" else RulePlanner(cfg)
-controller = Controller(cfg)
+from src.agent.registry import get_controller, get_planner
+
+# shared, process-wide instances (also used by the CLI and GUI)
+planner = get_planner()
+controller = get_controller()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # pre-warm tool modules so the first /run request pays no import cost
+    await controller.warmup()
+    yield
+
+
+app = FastAPI(title="Personal Task Automation Agent", lifespan=lifespan)
 
 
 class RunRequest(BaseModel):
@@ -0,0 +1,35 @@
+"""Helpers for reading step outputs from the shared execution context."""
+from typing import Any, Iterator
+
+_IDX_KEY = "__idx__"
+
+
+def step_outputs(context: dict) -> Iterator[dict]:
+    """Yield every step-output dict in the context, skipping the memo index.
+
+    Tools that scan the whole context must use this instead of
+    `context.values()` so the `first()` memo is never mistaken for a
+    step output.
+    """
+    for k, v in context.items():
+        if k != _IDX_KEY and isinstance(v, dict):
+            yield v
+
+
+def first(context: dict, key: str, default: Any = None) -> Any:
+    """Return `key` from the first step output that has a truthy value for it.
+
+    Hits are memoized on the context under a sentinel key, so repeated
+    lookups by later tools become O(1) dict reads instead of rescanning
+    every step output. Step outputs are append-only during a run, so a
+    memoized hit stays valid; misses are not cached because a later step
+    may still produce the value.
+    """
+    idx = context.setdefault(_IDX_KEY, {})
+    if key in idx:
+        return idx[key]
+    for k, v in context.items():
+        if k != _IDX_KEY and isinstance(v, dict) and v.get(key):
+            idx[key] = v[key]
+            return v[key]
+    return default
@@ -0,0 +1,79 @@
+"""Shared pooled HTTP session for the tool modules.
+
+One `requests.Session` with a sized connection pool means TLS handshakes
+and keep-alive connections are amortized across scraper and search calls
+instead of being re-established per request.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from urllib3.util.retry import Retry
+    _RETRIES = Retry(total=2, backoff_factor=0.2)
+except Exception:
+    _RETRIES = 2
+
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=_RETRIES)
+
+SESSION = requests.Session()
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+SESSION.headers.update({
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+})
+
+# Scrapers only keep the first ~20 paragraphs of a page, so there is no
+# point downloading or parsing more than this many bytes of body
+MAX_BODY_BYTES = 512 * 1024
+
+
+class TTLTextCache:
+    """Small thread-safe LRU cache for scraped page text with TTL + ETags.
+
+    Fresh entries are served directly; expired entries keep their text and
+    ETag around so the next fetch can revalidate with If-None-Match and a
+    304 response refreshes the entry without re-downloading the body.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+        self._etags: dict = {}
+        self._lock = threading.Lock()
+
+    def get_fresh(self, url: str):
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry and time.time() - entry[0] < self.ttl:
+                self._entries.move_to_end(url)
+                return entry[1]
+        return None
+
+    def etag(self, url: str):
+        with self._lock:
+            return self._etags.get(url)
+
+    def put(self, url: str, text: str, etag: str | None = None):
+        with self._lock:
+            self._entries[url] = (time.time(), text)
+            self._entries.move_to_end(url)
+            if etag:
+                self._etags[url] = etag
+            while len(self._entries) > self.maxsize:
+                evicted, _ = self._entries.popitem(last=False)
+                self._etags.pop(evicted, None)
+
+    def refresh(self, url: str):
+        """Re-stamp an entry after a 304 and return its text (or None)."""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return None
+            self._entries[url] = (time.time(), entry[1])
+            self._entries.move_to_end(url)
+            return entry[1]
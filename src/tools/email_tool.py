@@ -4,10 +4,76 @@ If SMTP settings are not configured, it writes the outgoing email to logs
 for demo purposes.
 """
 from typing import Tuple, List
+import atexit
+import io
+import re
 import smtplib
+import threading
 from email.message import EmailMessage
 import os
 
+from src.tools._context_utils import first, step_outputs
+
+# One alternation matches both URLs (for clickable links) and newlines
+# (for <br> insertion), so HTML conversion walks the body a single time
+_HTMLIZE_RE = re.compile(r'(https?://[^\s<>]+)|(\n)')
+
+
+def _htmlize_match(m: re.Match) -> str:
+    url = m.group(1)
+    if url:
+        return f'<a href="{url}" style="color: #0066cc; text-decoration: underline;">{url}</a>'
+    return '<br>\n'
+
+# Constant halves of the HTML wrapper; only the body varies per send
+_HTML_PREFIX = """
+    <html>
+    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
+        <div style="max-width: 800px; margin: 0 auto; padding: 20px;">
+            """
+_HTML_SUFFIX = """
+        </div>
+    </body>
+    </html>
+    """
+
+# Cached SMTP connections keyed by (host, port, user) so repeated sends
+# skip the TLS handshake and login; closed at process exit. smtplib
+# connections are not thread-safe, so _SMTP_LOCK is held for the whole
+# healthcheck-and-send, never just the cache lookup.
+_SMTP_CACHE: dict = {}
+_SMTP_LOCK = threading.Lock()
+
+
+def _get_smtp(host: str, port: int, user: str, password: str) -> smtplib.SMTP:
+    """Return a cached (or fresh) connection; caller must hold _SMTP_LOCK."""
+    key = (host, port, user)
+    s = _SMTP_CACHE.get(key)
+    if s is not None:
+        try:
+            s.noop()
+            return s
+        except Exception:
+            _SMTP_CACHE.pop(key, None)
+    s = smtplib.SMTP(host, port, timeout=20)
+    s.starttls()
+    s.login(user, password)
+    _SMTP_CACHE[key] = s
+    return s
+
+
+def _close_smtp_cache():
+    with _SMTP_LOCK:
+        for s in _SMTP_CACHE.values():
+            try:
+                s.quit()
+            except Exception:
+                pass
+        _SMTP_CACHE.clear()
+
+
+atexit.register(_close_smtp_cache)
+
 
 def run(args: dict, context: dict) -> Tuple[List[str], dict]:
     to = args.get("to") or ""
@@ -19,37 +85,32 @@ def run(args: dict, context: dict) -> Tuple[List[str], dict]:
     # If body not provided, collect summary from context
     if not body:
         # Look for summary first
-        for v in context.values():
-            if isinstance(v, dict) and v.get("summary"):
-                body = v.get("summary")
-                break
-        
-        # If no summary, try to collect search results or scraped content
+        body = first(context, "summary")
+
+        # If no summary, try to collect search results or scraped content;
+        # write into one buffer instead of accumulating many small strings
         if not body:
-            content_parts = []
-            for v in context.values():
-                if isinstance(v, dict):
-                    # Search results
-                    if v.get("results"):
-                        content_parts.append("Search Results:\n" + "="*50)
-                        for i, r in enumerate(v.get("results", [])[:10], 1):
-                            title = r.get("title", "")
-                            snippet = r.get("snippet", "")
-                            link = r.get("url") or r.get("link", "")  # Support both field names
-                            content_parts.append(f"\n{i}. {title}")
-                            content_parts.append(f"   {snippet}")
-                            if link:
-                                content_parts.append(f"   {link}\n")
-                    # Scraped pages
-                    elif v.get("pages"):
-                        content_parts.append("Scraped Content:\n" + "="*50)
-                        for p in v.get("pages", [])[:3]:
-                            url = p.get("url", "")
-                            text = p.get("text", "")[:500]
-                            content_parts.append(f"\n🔗 {url}\n{text}...\n")
-            
-            if content_parts:
-                body = "\n".join(content_parts)
+            buf = io.StringIO()
+            for v in step_outputs(context):
+                # Search results
+                if v.get("results"):
+                    buf.write("Search Results:\n" + "="*50)
+                    for i, r in enumerate(v.get("results", [])[:10], 1):
+                        title = r.get("title", "")
+                        snippet = r.get("snippet", "")
+                        link = r.get("url") or r.get("link", "")  # Support both field names
+                        buf.write(f"\n\n{i}. {title}\n   {snippet}")
+                        if link:
+                            buf.write(f"\n   {link}\n")
+                # Scraped pages
+                elif v.get("pages"):
+                    buf.write("Scraped Content:\n" + "="*50)
+                    for p in v.get("pages", [])[:3]:
+                        url = p.get("url", "")
+                        text = p.get("text", "")[:500]
+                        buf.write(f"\n\n🔗 {url}\n{text}...\n")
+
+            body = buf.getvalue() or None
 
     if not body:
         body = "(no content available)"
@@ -75,29 +136,15 @@ def run(args: dict, context: dict) -> Tuple[List[str], dict]:
     # Set plain text version
     msg.set_content(body)
     
-    # Add HTML version with clickable links
-    import re
-    # Convert all URLs to clickable links - match any http/https URL
-    url_pattern = r'(https?://[^\s<>]+)'
-    html_body = re.sub(url_pattern, r'<a href="\1" style="color: #0066cc; text-decoration: underline;">\1</a>', body)
-    
-    # Format as HTML with proper styling
-    html_body = html_body.replace("\n", "<br>\n")
-    html_content = f"""
-    <html>
-    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-        <div style="max-width: 800px; margin: 0 auto; padding: 20px;">
-            {html_body}
-        </div>
-    </body>
-    </html>
-    """
-    msg.add_alternative(html_content, subtype='html')
+    # Add HTML version with clickable links and <br> line breaks (one pass)
+    html_body = _HTMLIZE_RE.sub(_htmlize_match, body)
+    msg.add_alternative(_HTML_PREFIX + html_body + _HTML_SUFFIX, subtype='html')
 
     try:
-        with smtplib.SMTP(smtp_host, smtp_port, timeout=20) as s:
-            s.starttls()
-            s.login(smtp_user, smtp_pass)
+        # the shared connection handles one send at a time; concurrent
+        # sends would interleave protocol commands on the same socket
+        with _SMTP_LOCK:
+            s = _get_smtp(smtp_host, smtp_port, smtp_user, smtp_pass)
             s.send_message(msg)
         logs.append(f"Email sent to {to}")
         return logs, {"email_sent": True, "to": to, "subject": subject}
@@ -1,5 +1,11 @@
 """Job matcher tool - searches for jobs based on resume analysis."""
 from typing import Tuple, List
+import re
+
+from src.tools._context_utils import first
+
+# One DFA scan for job-ness instead of ten substring probes per result
+_JOB_RE = re.compile(r'job|career|hiring|position|opening', re.IGNORECASE)
 
 
 def run(args: dict, context: dict) -> Tuple[List[str], dict]:
@@ -15,12 +21,8 @@ def run(args: dict, context: dict) -> Tuple[List[str], dict]:
     logs = []
     
     # Get analysis from context
-    analysis = None
-    for key, value in context.items():
-        if isinstance(value, dict) and "analysis" in value:
-            analysis = value["analysis"]
-            break
-    
+    analysis = first(context, "analysis")
+
     if not analysis:
         logs.append("Error: No resume analysis found in context")
         return logs, {"error": "No analysis available"}
@@ -54,22 +56,23 @@ def run(args: dict, context: dict) -> Tuple[List[str], dict]:
     
     job_results = search_output.get("results", [])
     
-    # Filter and enhance results
+    # Filter and enhance results; lowercase each skill once, not per result
+    skills_lower = [(skill, skill.lower()) for skill in skills]
     job_matches = []
     for result in job_results:
         # Basic filtering for job-related results
-        title_lower = result.get("title", "").lower()
-        snippet_lower = result.get("snippet", "").lower()
-        
-        is_job = any(keyword in title_lower or keyword in snippet_lower 
-                    for keyword in ["job", "career", "hiring", "position", "opening"])
-        
+        title = result.get("title", "")
+        snippet = result.get("snippet", "")
+        snippet_lower = snippet.lower()
+
+        is_job = bool(_JOB_RE.search(title) or _JOB_RE.search(snippet))
+
         job_matches.append({
             "title": result.get("title"),
             "url": result.get("url"),
             "snippet": result.get("snippet"),
             "relevance": "high" if is_job else "medium",
-            "matched_skills": [skill for skill in skills if skill.lower() in snippet_lower]
+            "matched_skills": [skill for skill, low in skills_lower if low in snippet_lower]
         })
     
     logs.append(f"Found {len(job_matches)} potential job matches")
@@ -1,8 +1,51 @@
 """Resume analyzer tool - analyzes resume content using AI."""
 from typing import Tuple, List
+import hashlib
 import os
 import json
 
+from src.tools._context_utils import first
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+# Completed AI analyses keyed by resume-text hash, so re-analyzing the
+# same resume in a session costs no tokens and returns instantly. Keyword
+# fallbacks are never cached: a transient API error must not downgrade a
+# resume to basic analysis for the rest of the process.
+_ANALYSIS_CACHE: dict = {}
+
+# Common technical skills
+_TECH_SKILLS = ['python', 'java', 'javascript', 'react', 'node', 'sql', 'aws',
+                'docker', 'kubernetes', 'machine learning', 'ai', 'data science',
+                'frontend', 'backend', 'fullstack', 'devops', 'cloud']
+
+_EDUCATION_KEYWORDS = ['bachelor', 'master', 'phd', 'mba', 'degree', 'university', 'college']
+
+# Checked in order; the first group with a hit decides the field
+_FIELD_GROUPS = [
+    ("Data Science / AI", ('data', 'analytics', 'ml', 'ai')),
+    ("Web Development", ('web', 'frontend', 'backend', 'fullstack')),
+    ("DevOps / Cloud", ('devops', 'cloud', 'infrastructure')),
+]
+
+# Build one Aho-Corasick automaton over every keyword so the basic analysis
+# scans the resume in a single pass; falls back to substring scans without it.
+try:
+    import ahocorasick
+
+    _AUTOMATON = ahocorasick.Automaton()
+    _all_words = set(_TECH_SKILLS) | set(_EDUCATION_KEYWORDS)
+    for _, _words in _FIELD_GROUPS:
+        _all_words |= set(_words)
+    for _word in _all_words:
+        _AUTOMATON.add_word(_word, _word)
+    _AUTOMATON.make_automaton()
+except ImportError:
+    _AUTOMATON = None
+
 
 def run(args: dict, context: dict) -> Tuple[List[str], dict]:
     """Analyze resume and extract key information.
@@ -17,33 +60,36 @@ def run(args: dict, context: dict) -> Tuple[List[str], dict]:
     logs = []
     
     # Get resume text from context
-    resume_text = None
-    for key, value in context.items():
-        if isinstance(value, dict) and "resume_text" in value:
-            resume_text = value["resume_text"]
-            break
-    
+    resume_text = first(context, "resume_text")
+
     if not resume_text:
         logs.append("Error: No resume text found in context")
         return logs, {"error": "No resume text available"}
     
+    resume_hash = hashlib.blake2b(resume_text.encode(), digest_size=16).hexdigest()
+    cached = _ANALYSIS_CACHE.get(resume_hash)
+    if cached is not None:
+        logs.append("Using cached analysis for this resume")
+        return logs, {"analysis": cached}
+
     logs.append("Analyzing resume content...")
-    
+
     # Use OpenAI if available, otherwise basic extraction
     openai_key = os.getenv("OPENAI_API_KEY")
-    
-    if openai_key:
-        analysis = _analyze_with_ai(resume_text, logs)
+
+    analysis = _analyze_with_ai(resume_text, logs) if openai_key else None
+    if analysis is not None:
+        _ANALYSIS_CACHE[resume_hash] = analysis
     else:
         analysis = _analyze_basic(resume_text, logs)
-    
+
     logs.append(f"Analysis complete - Found {len(analysis.get('skills', []))} skills")
-    
+
     return logs, {"analysis": analysis}
 
 
-def _analyze_with_ai(resume_text: str, logs: List[str]) -> dict:
-    """Analyze resume using OpenAI."""
+def _analyze_with_ai(resume_text: str, logs: List[str]):
+    """Analyze resume using OpenAI; returns None if the call fails."""
     try:
         from openai import OpenAI
         client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
@@ -70,49 +116,43 @@ Return ONLY valid JSON with these keys: name, current_role, years_experience, sk
             messages=[{"role": "user", "content": prompt}],
             temperature=0.3,
             max_tokens=1000,
+            # guarantees valid JSON, so no markdown-fence stripping needed
+            response_format={"type": "json_object"},
         )
-        
+
         content = response.choices[0].message.content.strip()
-        
-        # Extract JSON from markdown if needed
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0].strip()
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0].strip()
-        
-        analysis = json.loads(content)
+        analysis = orjson.loads(content) if orjson else json.loads(content)
         logs.append("Used AI analysis (OpenAI)")
         return analysis
         
     except Exception as e:
         logs.append(f"AI analysis failed: {e}, using basic extraction")
-        return _analyze_basic(resume_text, logs)
+        return None
 
 
 def _analyze_basic(resume_text: str, logs: List[str]) -> dict:
     """Basic keyword-based resume analysis."""
     text_lower = resume_text.lower()
-    
-    # Common technical skills
-    tech_skills = ['python', 'java', 'javascript', 'react', 'node', 'sql', 'aws', 
-                   'docker', 'kubernetes', 'machine learning', 'ai', 'data science',
-                   'frontend', 'backend', 'fullstack', 'devops', 'cloud']
-    
-    found_skills = [skill for skill in tech_skills if skill in text_lower]
-    
-    # Extract education keywords
-    education_keywords = ['bachelor', 'master', 'phd', 'mba', 'degree', 'university', 'college']
-    has_education = any(keyword in text_lower for keyword in education_keywords)
-    
-    # Determine field
-    field = "Technology"
-    if any(word in text_lower for word in ['data', 'analytics', 'ml', 'ai']):
-        field = "Data Science / AI"
-    elif any(word in text_lower for word in ['web', 'frontend', 'backend', 'fullstack']):
-        field = "Web Development"
-    elif any(word in text_lower for word in ['devops', 'cloud', 'infrastructure']):
-        field = "DevOps / Cloud"
-    
+
+    if _AUTOMATON is not None:
+        # single O(n) pass over the resume for every keyword group
+        hits = {word for _, word in _AUTOMATON.iter(text_lower)}
+        found_skills = [skill for skill in _TECH_SKILLS if skill in hits]
+        has_education = any(keyword in hits for keyword in _EDUCATION_KEYWORDS)
+        field = "Technology"
+        for field_name, words in _FIELD_GROUPS:
+            if any(word in hits for word in words):
+                field = field_name
+                break
+    else:
+        found_skills = [skill for skill in _TECH_SKILLS if skill in text_lower]
+        has_education = any(keyword in text_lower for keyword in _EDUCATION_KEYWORDS)
+        field = "Technology"
+        for field_name, words in _FIELD_GROUPS:
+            if any(word in text_lower for word in words):
+                field = field_name
+                break
+
     logs.append("Used basic keyword analysis (add OpenAI key for AI analysis)")
     
     return {
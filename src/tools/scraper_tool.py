@@ -4,17 +4,56 @@ Given `args` with either a `url` or `top_k` and a `context` that may contain
 search results, it fetches pages and extracts text paragraphs.
 """
 from typing import Tuple, List
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from bs4 import BeautifulSoup
 
+from src.tools._context_utils import first
+from src.tools._http import MAX_BODY_BYTES, SESSION as _SESSION, TTLTextCache
+
+# extracted page text cached per URL, revalidated via ETag after expiry
+_PAGE_CACHE = TTLTextCache()
+
+# lxml (libxml2) parses several times faster than the pure-Python parser
+try:
+    import lxml  # noqa: F401
+    _BS_PARSER = "lxml"
+except ImportError:
+    _BS_PARSER = "html.parser"
+
 
 def _extract_text(html: str) -> str:
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, _BS_PARSER)
     # Grab visible paragraph text
     ps = [p.get_text(strip=True) for p in soup.find_all("p") if p.get_text(strip=True)]
     return "\n\n".join(ps[:20])
 
 
+def _fetch_one(url: str) -> dict:
+    """Fetch and extract a single page; never raises."""
+    cached = _PAGE_CACHE.get_fresh(url)
+    if cached is not None:
+        return {"url": url, "text": cached or "(no text)", "log": f"Cache hit for {url}"}
+    try:
+        etag = _PAGE_CACHE.etag(url)
+        headers = {"If-None-Match": etag} if etag else None
+        with _SESSION.get(url, timeout=10, headers=headers, stream=True) as r:
+            if r.status_code == 304:
+                text = _PAGE_CACHE.refresh(url)
+                if text is not None:
+                    return {"url": url, "text": text or "(no text)", "log": f"Revalidated {url} (304 Not Modified)"}
+            if r.status_code == 200:
+                # read a bounded amount of body; huge pages add nothing
+                raw = r.raw.read(MAX_BODY_BYTES, decode_content=True)
+                html = raw.decode(r.encoding or "utf-8", errors="replace")
+                text = _extract_text(html)
+                _PAGE_CACHE.put(url, text, r.headers.get("ETag"))
+                capped = " (body capped)" if len(raw) >= MAX_BODY_BYTES else ""
+                return {"url": url, "text": text or "(no text)", "log": f"Scraped {url} ({len(text)} chars){capped}"}
+            return {"url": url, "text": None, "log": f"Failed to fetch {url}: status {r.status_code}"}
+    except Exception as e:
+        return {"url": url, "text": None, "log": f"Error fetching {url}: {e}"}
+
+
 def run(args: dict, context: dict) -> Tuple[List[str], dict]:
     logs = []
     outputs = []
@@ -23,27 +62,24 @@ def run(args: dict, context: dict) -> Tuple[List[str], dict]:
         urls = [args["url"]]
     else:
         # pull URLs from previous search results in context
-        results = None
-        for k, v in context.items():
-            if isinstance(v, dict) and v.get("results"):
-                results = v.get("results")
-                break
+        results = first(context, "results")
         if not results:
             return ["No URLs or search results available to scrape"], {"pages": []}
         top_k = int(args.get("top_k", 3))
         urls = [r.get("url") for r in results[:top_k]]
 
-    for u in urls:
-        try:
-            logs.append(f"Fetching {u}")
-            r = requests.get(u, timeout=10)
-            if r.status_code == 200:
-                text = _extract_text(r.text)
-                outputs.append({"url": u, "text": text or "(no text)"})
-                logs.append(f"Scraped {u} ({len(text)} chars)")
-            else:
-                logs.append(f"Failed to fetch {u}: status {r.status_code}")
-        except Exception as e:
-            logs.append(f"Error fetching {u}: {e}")
+    # an empty list would also blow up the executor (max_workers must be > 0)
+    if not urls:
+        return ["No URLs to scrape"], {"pages": []}
+
+    # fetch all pages concurrently (I/O-bound), keep logs in input order
+    logs.extend(f"Fetching {u}" for u in urls)
+    with ThreadPoolExecutor(max_workers=min(len(urls), 8)) as ex:
+        results = list(ex.map(_fetch_one, urls))
+
+    for res in results:
+        logs.append(res["log"])
+        if res["text"] is not None:
+            outputs.append({"url": res["url"], "text": res["text"]})
 
     return logs, {"pages": outputs}
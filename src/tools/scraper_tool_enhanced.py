@@ -3,14 +3,28 @@
 Falls back to requests+BeautifulSoup if Playwright is not configured.
 """
 from typing import Tuple, List
+from concurrent.futures import ThreadPoolExecutor
+import atexit
 import os
-import requests
 from bs4 import BeautifulSoup
 
+from src.tools._context_utils import first
+from src.tools._http import MAX_BODY_BYTES, SESSION as _SESSION, TTLTextCache
+
+# extracted page text cached per URL, revalidated via ETag after expiry
+_PAGE_CACHE = TTLTextCache()
+
+# lxml (libxml2) parses several times faster than the pure-Python parser
+try:
+    import lxml  # noqa: F401
+    _BS_PARSER = "lxml"
+except ImportError:
+    _BS_PARSER = "html.parser"
+
 
 def _extract_text_bs4(html: str) -> str:
     """Extract text using BeautifulSoup."""
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, _BS_PARSER)
     # Remove script and style elements
     for script in soup(["script", "style"]):
         script.decompose()
@@ -28,31 +42,94 @@ def _extract_text_bs4(html: str) -> str:
 
 def _scrape_with_requests(url: str) -> str:
     """Scrape using requests + BeautifulSoup."""
+    cached = _PAGE_CACHE.get_fresh(url)
+    if cached is not None:
+        return cached
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        }
-        resp = requests.get(url, headers=headers, timeout=15)
-        if resp.status_code == 200:
-            return _extract_text_bs4(resp.text)
-        return f"(HTTP {resp.status_code})"
+        # the shared session already carries a browser User-Agent
+        etag = _PAGE_CACHE.etag(url)
+        headers = {"If-None-Match": etag} if etag else None
+        with _SESSION.get(url, timeout=15, headers=headers, stream=True) as resp:
+            if resp.status_code == 304:
+                text = _PAGE_CACHE.refresh(url)
+                if text is not None:
+                    return text
+            if resp.status_code == 200:
+                # read a bounded amount of body; huge pages add nothing
+                raw = resp.raw.read(MAX_BODY_BYTES, decode_content=True)
+                html = raw.decode(resp.encoding or "utf-8", errors="replace")
+                text = _extract_text_bs4(html)
+                _PAGE_CACHE.put(url, text, resp.headers.get("ETag"))
+                return text
+            return f"(HTTP {resp.status_code})"
     except Exception as e:
         return f"(Error: {e})"
 
 
-def _scrape_with_playwright(url: str) -> str:
+# Chromium is launched once and reused across scrapes; spawning a browser
+# per URL costs seconds. Closed at process exit. Sync-API Playwright
+# objects are greenlet-bound to the thread that created them, and tool
+# runs land on arbitrary asyncio worker threads, so every Playwright call
+# is funneled through this dedicated single-thread executor.
+_PW = None
+_BROWSER = None
+_PW_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="playwright")
+
+
+def _get_browser():
+    # only ever called on the _PW_EXECUTOR thread
+    global _PW, _BROWSER
+    if _BROWSER is None or not _BROWSER.is_connected():
+        from playwright.sync_api import sync_playwright
+        _PW = sync_playwright().start()
+        _BROWSER = _PW.chromium.launch(headless=True)
+    return _BROWSER
+
+
+def _close_browser():
+    def _close():
+        try:
+            if _BROWSER is not None:
+                _BROWSER.close()
+            if _PW is not None:
+                _PW.stop()
+        except Exception:
+            pass
+
+    try:
+        _PW_EXECUTOR.submit(_close).result(timeout=10)
+    except Exception:
+        pass
+    _PW_EXECUTOR.shutdown(wait=False)
+
+
+atexit.register(_close_browser)
+
+
+def _render_page(url: str, wait_selector: str | None) -> str:
+    """Load a page and return its HTML; runs on the _PW_EXECUTOR thread."""
+    page = _get_browser().new_page()
+    try:
+        page.goto(url, timeout=20000)
+        # wait for the page to settle instead of sleeping a fixed 2s;
+        # fast pages return as soon as the network goes idle
+        try:
+            if wait_selector:
+                page.wait_for_selector(wait_selector, timeout=5000)
+            else:
+                page.wait_for_load_state("networkidle", timeout=5000)
+        except Exception:
+            pass  # scrape whatever has rendered so far
+        return page.content()
+    finally:
+        page.close()
+
+
+def _scrape_with_playwright(url: str, wait_selector: str | None = None) -> str:
     """Scrape using Playwright for JS-rendered content."""
     try:
-        from playwright.sync_api import sync_playwright
-        
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(url, timeout=20000)
-            page.wait_for_timeout(2000)  # Wait for JS to render
-            content = page.content()
-            browser.close()
-            return _extract_text_bs4(content)
+        content = _PW_EXECUTOR.submit(_render_page, url, wait_selector).result()
+        return _extract_text_bs4(content)
     except ImportError:
         return "(Playwright not installed)"
     except Exception as e:
@@ -69,27 +146,29 @@ def run(args: dict, context: dict) -> Tuple[List[str], dict]:
         urls = [args["url"]]
     else:
         # Pull URLs from previous search results
-        results = None
-        for k, v in context.items():
-            if isinstance(v, dict) and v.get("results"):
-                results = v.get("results")
-                break
+        results = first(context, "results")
         if not results:
             return ["No URLs or search results available to scrape"], {"pages": []}
         
         top_k = int(args.get("top_k", 3))
         urls = [r.get("url") for r in results[:top_k] if r.get("url")]
-    
-    # Scrape each URL
-    for url in urls:
-        logs.append(f"Fetching {url} (mode: {scraper_mode})")
-        
-        if scraper_mode == "playwright":
-            text = _scrape_with_playwright(url)
-        else:
-            text = _scrape_with_requests(url)
-        
+
+    # an empty list would also blow up the executor (max_workers must be > 0)
+    if not urls:
+        return ["No URLs to scrape"], {"pages": []}
+
+    # Scrape URLs; the requests path runs concurrently since it's I/O-bound
+    logs.extend(f"Fetching {url} (mode: {scraper_mode})" for url in urls)
+
+    if scraper_mode == "playwright":
+        wait_selector = args.get("wait_selector")
+        texts = [_scrape_with_playwright(url, wait_selector) for url in urls]
+    else:
+        with ThreadPoolExecutor(max_workers=min(len(urls), 8)) as ex:
+            texts = list(ex.map(_scrape_with_requests, urls))
+
+    for url, text in zip(urls, texts):
         outputs.append({"url": url, "text": text})
         logs.append(f"Scraped {url} ({len(text)} chars)")
-    
+
     return logs, {"pages": outputs}
@@ -3,8 +3,20 @@
 Falls back to fake results if no API keys are configured.
 """
 from typing import Tuple, List
+import json
 import os
-import requests
+
+from src.tools._http import SESSION as _SESSION
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+
+def _loads(raw):
+    """Parse raw response bytes, with orjson when it is installed."""
+    return orjson.loads(raw) if orjson else json.loads(raw)
 
 
 def _serpapi_search(query: str, limit: int = 5) -> List[dict]:
@@ -20,9 +32,9 @@ def _serpapi_search(query: str, limit: int = 5) -> List[dict]:
             "api_key": api_key,
             "num": limit,
         }
-        resp = requests.get(url, params=params, timeout=15)
+        resp = _SESSION.get(url, params=params, timeout=15)
         if resp.status_code == 200:
-            data = resp.json()
+            data = _loads(resp.content)
             results = []
             for item in data.get("organic_results", [])[:limit]:
                 results.append({
@@ -51,9 +63,9 @@ def _google_custom_search(query: str, limit: int = 5) -> List[dict]:
             "q": query,
             "num": limit,
         }
-        resp = requests.get(url, params=params, timeout=15)
+        resp = _SESSION.get(url, params=params, timeout=15)
         if resp.status_code == 200:
-            data = resp.json()
+            data = _loads(resp.content)
             results = []
             for item in data.get("items", [])[:limit]:
                 results.append({
@@ -3,15 +3,32 @@ from typing import Tuple, List
 import os
 import re
 
+from src.tools._context_utils import step_outputs
+
 try:
-    import openai
+    from openai import OpenAI
 except Exception:
-    openai = None
+    OpenAI = None
+
+# lazily-created shared client so the connection pool persists across calls
+_CLIENT = None
+
+
+def _get_client():
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    return _CLIENT
+
+_SENT_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# only this much text ever reaches the prompt or the extractive fallback
+_MAX_CHARS = 3000
 
 
 def _simple_extractive(text: str, max_sentences: int = 5) -> str:
     # naive sentence split
-    sentences = re.split(r'(?<=[.!?])\s+', text.strip())
+    sentences = _SENT_SPLIT_RE.split(text.strip())
     return "\n- " + "\n- ".join(sentences[:max_sentences])
 
 
@@ -22,26 +39,37 @@ def run(args: dict, context: dict) -> Tuple[List[str], dict]:
 
     # collect text from context (scrape outputs first, then search snippets)
     texts = []
-    for v in context.values():
-        if isinstance(v, dict) and v.get("pages"):
+    for v in step_outputs(context):
+        if v.get("pages"):
             for p in v.get("pages", []):
                 texts.append(p.get("text", ""))
-        if isinstance(v, dict) and v.get("results"):
+        if v.get("results"):
             texts.extend([r.get("snippet", "") for r in v.get("results")])
 
-    joined = "\n\n".join([t for t in texts if t])
+    # truncate while joining: no point concatenating megabytes of page text
+    # only to slice off the first few thousand characters afterwards
+    parts = []
+    size = 0
+    for t in texts:
+        if not t:
+            continue
+        take = t[:_MAX_CHARS - size]
+        parts.append(take)
+        size += len(take)
+        if size >= _MAX_CHARS:
+            break
+    joined = "\n\n".join(parts)
     if not joined:
         logs.append("No content found to summarise")
         return logs, {"summary": "(no content)"}
 
     # If OpenAI is configured, call completion
-    if openai and os.getenv("OPENAI_API_KEY"):
+    if OpenAI and os.getenv("OPENAI_API_KEY"):
         try:
-            openai.api_key = os.getenv("OPENAI_API_KEY")
-            prompt = f"Summarize the following text in {max_sentences} bullets:\n\n{joined[:3000]}"
-            resp = openai.ChatCompletion.create(
-                model="gpt-4o-mini" if True else "gpt-4",
-                messages=[{"role":"user","content":prompt}],
+            prompt = f"Summarize the following text in {max_sentences} bullets:\n\n{joined}"
+            resp = _get_client().chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": prompt}],
                 max_tokens=400,
             )
             summary = resp.choices[0].message.content.strip()
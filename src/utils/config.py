@@ -12,5 +12,7 @@ def load_config():
         "SMTP_USER": os.getenv("SMTP_USER"),
         "SMTP_PASSWORD": os.getenv("SMTP_PASSWORD"),
         "DEFAULT_FROM": os.getenv("DEFAULT_FROM"),
+        "MAX_RETRIES": os.getenv("MAX_RETRIES"),
+        "RETRY_BASE_DELAY": os.getenv("RETRY_BASE_DELAY"),
     }
     return cfg